@@ -73,6 +73,8 @@ def main():
     validate_parser.add_argument("--required-skipped", help="e.g. 'lt:10'.")
     validate_parser.add_argument("--no-cleanup", action="store_true",
                                  help="If set, do NOT remove the temporary test directory for Git-based deps.")
+    validate_parser.add_argument("--in-process-tests", action="store_true",
+                                 help="Run pytest inside this interpreter instead of via 'poetry run pytest' (single/monorepo test modes only).")
 
     # -------------------------------------------------------------------------
     # release
@@ -82,13 +84,16 @@ def main():
     release_parser.add_argument("-d", "--directory", help="Directory with multiple pyprojects or aggregator.")
     release_parser.add_argument("-R", "--recursive", action="store_true", help="Recursively find pyproject.toml files.")
     release_parser.add_argument("--test-mode", choices=["single","monorepo","each"], default="single")
-    release_parser.add_argument("--num-workers", type=int, default=1)
+    release_parser.add_argument("--num-workers", type=int, default=1,
+                                help="Number of parallel pytest workers and concurrent package builds.")
     release_parser.add_argument("--results-json", help="JSON test-results file for analysis.")
     release_parser.add_argument("--required-passed", help="e.g. 'ge:80'.")
     release_parser.add_argument("--required-skipped", help="e.g. 'lt:10'.")
     release_parser.add_argument("--publish-password", help="PyPI password.")
     release_parser.add_argument("--no-cleanup", action="store_true",
                                 help="If set, do NOT remove the temporary test directory for Git-based deps.")
+    release_parser.add_argument("--in-process-tests", action="store_true",
+                                help="Run pytest inside this interpreter instead of via 'poetry run pytest' (single/monorepo test modes only).")
 
     args = parser.parse_args()
 
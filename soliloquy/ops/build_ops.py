@@ -2,16 +2,18 @@
 
 import os
 import sys
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from graphlib import TopologicalSorter, CycleError
+from typing import Optional, List, Dict, Set, Tuple
 
-import tomlkit
-from soliloquy.ops.pyproject_ops import find_pyproject_files, extract_path_dependencies
+from soliloquy.ops.pyproject_ops import find_pyproject_files, path_dependency_pyproject, load_pyproject
 from soliloquy.ops.poetry_utils import run_command  # A helper that calls subprocess
 
 def build_packages(
     file: Optional[str] = None,
     directory: Optional[str] = None,
-    recursive: bool = False
+    recursive: bool = False,
+    num_workers: int = 1
 ) -> bool:
     """
     Finds pyproject.toml files (via file/directory/recursive),
@@ -23,6 +25,12 @@ def build_packages(
         we skip building it directly, but we build each local
         path dependency referenced in it.
 
+    Every package is built exactly once, even if it is both discovered
+    directly and referenced by an aggregator. Packages are built in
+    dependency order: a package's local path dependencies are built
+    before the package itself. Packages whose dependencies are done are
+    built in parallel batches of up to `num_workers`.
+
     Returns:
         True if all builds succeed, False otherwise.
     """
@@ -32,45 +40,127 @@ def build_packages(
         print(f"[build_ops] Error finding pyproject files: {e}", file=sys.stderr)
         return False
 
-    overall_success = True
+    graph, overall_success = _collect_build_graph(pyprojects)
+
+    sorter = TopologicalSorter(graph)
+    try:
+        sorter.prepare()
+    except CycleError as e:
+        print(f"[build_ops] Circular path dependencies: {' -> '.join(e.args[1])}", file=sys.stderr)
+        return False
+
+    with ThreadPoolExecutor(max_workers=max(1, num_workers)) as executor:
+        while sorter.is_active():
+            batch = sorter.get_ready()
+            proj_dirs = [os.path.dirname(pyproj) for pyproj in batch]
+            for pyproj, success in zip(batch, executor.map(_run_poetry_build, proj_dirs)):
+                if not success:
+                    overall_success = False
+                sorter.done(pyproj)
+
+    if overall_success:
+        print("\n[build_ops] All builds completed successfully.")
+    else:
+        print("\n[build_ops] Some builds failed.", file=sys.stderr)
+    return overall_success
+
+
+def _collect_build_graph(pyprojects: List[str]) -> Tuple[Dict[str, Set[str]], bool]:
+    """
+    Decides which packages to build and how they depend on each other.
+
+    Returns:
+      (graph, success)
+        - graph: maps each pyproject.toml to build onto the set of
+          pyproject.toml files (also in the graph) it has path dependencies on.
+        - success: False if an aggregator referenced an invalid path dependency.
+    """
+    tables: Dict[str, dict] = {}
+    graph: Dict[str, Set[str]] = {}
+    success = True
+
+    def load(pyproj_path: str) -> dict:
+        key = os.path.normpath(pyproj_path)
+        if key not in tables:
+            tables[key] = _load_tool_poetry(key)
+        return tables[key]
 
     for pyproj_path in pyprojects:
         print(f"\n[build_ops] Examining: {pyproj_path}")
-        is_aggregator, pkg_name = _check_if_aggregator(pyproj_path)
+        tool_poetry = load(pyproj_path)
+        is_aggregator, pkg_name = _classify_tool_poetry(tool_poetry)
 
         if is_aggregator:
             print(f"  Detected aggregator (package-mode=false). Skipping build of aggregator itself.")
+            # Reuse the table we already parsed; an aggregator without any
+            # path dependencies has nothing to build, so skip it outright.
+            path_deps = _path_dependencies(tool_poetry)
+            if not path_deps:
+                print("  No local path dependencies found to build.")
+                continue
+
             # Instead, build local path dependencies
-            success = _build_local_path_dependencies(pyproj_path)
-            if not success:
-                overall_success = False
+            print(f"  Found {len(path_deps)} local path dependencies. Queueing each ...")
+            base_dir = os.path.dirname(pyproj_path)
+            for dep_rel_path in path_deps:
+                dep_pyproj = path_dependency_pyproject(base_dir, dep_rel_path)
+                if not dep_pyproj:
+                    print(f"    Skipping invalid path dependency {dep_rel_path} (no pyproject.toml).", file=sys.stderr)
+                    success = False
+                    continue
+                graph.setdefault(os.path.normpath(dep_pyproj), set())
         else:
             # Normal package => build it
-            print(f"  Detected normal package '{pkg_name}'. Building ...")
-            proj_dir = os.path.dirname(pyproj_path)
-            success = _run_poetry_build(proj_dir)
-            if not success:
-                overall_success = False
+            print(f"  Detected normal package '{pkg_name}'. Queueing build ...")
+            graph.setdefault(os.path.normpath(pyproj_path), set())
+
+    # Only order against path dependencies that are being built in this run
+    for pyproj_path, predecessors in graph.items():
+        base_dir = os.path.dirname(pyproj_path)
+        try:
+            tool_poetry = load(pyproj_path)
+        except Exception as e:
+            # No ordering info; its own 'poetry build' will report the problem
+            print(f"[build_ops] Could not read {pyproj_path}: {e}", file=sys.stderr)
+            continue
+        for dep_rel_path in _path_dependencies(tool_poetry):
+            dep_pyproj = path_dependency_pyproject(base_dir, dep_rel_path)
+            if dep_pyproj and os.path.normpath(dep_pyproj) in graph:
+                predecessors.add(os.path.normpath(dep_pyproj))
+
+    return graph, success
+
+
+def _path_dependencies(tool_poetry: dict) -> List[str]:
+    """
+    Returns the 'path' of each local path dependency in an
+    already-parsed [tool.poetry] table.
+    """
+    deps = tool_poetry.get("dependencies", {})
+    return [
+        val["path"] for val in deps.values()
+        if isinstance(val, dict) and "path" in val
+    ]
 
-    if overall_success:
-        print("\n[build_ops] All builds completed successfully.")
-    else:
-        print("\n[build_ops] Some builds failed.", file=sys.stderr)
-    return overall_success
+
+def _load_tool_poetry(pyproj_path: str) -> dict:
+    """
+    Parses the given pyproject.toml (cached via load_pyproject) and
+    returns its [tool.poetry] table (empty if missing).
+    """
+    doc = load_pyproject(pyproj_path)
+    return doc.get("tool", {}).get("poetry", {})
 
 
-def _check_if_aggregator(pyproj_path: str) -> (bool, str):
+def _classify_tool_poetry(tool_poetry: dict) -> (bool, str):
     """
-    Parses the given pyproject.toml with tomlkit, returns:
-      (is_aggregator: bool, package_name: str or 'unknown')
+    Given an already-parsed [tool.poetry] table, returns
+    (is_aggregator: bool, package_name: str or 'unknown')
 
     - aggregator if tool.poetry.package-mode == false
     - normal package otherwise
     - if name is missing, returns 'unknown'
     """
-    with open(pyproj_path, "r", encoding="utf-8") as f:
-        doc = tomlkit.parse(f.read())
-    tool_poetry = doc.get("tool", {}).get("poetry", {})
     pkg_name = tool_poetry.get("name", "unknown")
 
     # If package-mode is explicitly false, treat as aggregator
@@ -83,36 +173,6 @@ def _check_if_aggregator(pyproj_path: str) -> (bool, str):
     return is_aggregator, pkg_name
 
 
-def _build_local_path_dependencies(pyproj_path: str) -> bool:
-    """
-    For the aggregator pyproject, gather local path dependencies
-    and build each. Returns True if all succeed, otherwise False.
-    """
-    deps = extract_path_dependencies(pyproj_path)
-    if not deps:
-        print("  No local path dependencies found to build.")
-        return True
-
-    base_dir = os.path.dirname(pyproj_path)
-    overall_success = True
-
-    print(f"  Found {len(deps)} local path dependencies. Building each ...")
-    for dep_rel_path in deps:
-        dep_abs_path = os.path.join(base_dir, dep_rel_path)
-        dep_pyproj = os.path.join(dep_abs_path, "pyproject.toml")
-
-        if not os.path.isdir(dep_abs_path) or not os.path.isfile(dep_pyproj):
-            print(f"    Skipping invalid path dependency {dep_rel_path} (no pyproject.toml).", file=sys.stderr)
-            overall_success = False
-            continue
-
-        print(f"    Building local path dependency at {dep_abs_path} ...")
-        success = _run_poetry_build(dep_abs_path)
-        if not success:
-            overall_success = False
-    return overall_success
-
-
 def _run_poetry_build(package_dir: str) -> bool:
     """
     Helper that runs 'poetry build' in the given directory.
@@ -2,10 +2,9 @@
 
 import os
 import sys
-import tomlkit
 from typing import Optional
 
-from soliloquy.ops.pyproject_ops import find_pyproject_files, extract_path_dependencies
+from soliloquy.ops.pyproject_ops import find_pyproject_files, extract_path_dependencies, load_pyproject
 from soliloquy.ops.poetry_utils import run_command
 
 def install_packages(
@@ -67,12 +66,11 @@ def install_packages(
 
 def _check_if_aggregator(pyproj_path: str) -> (bool, str):
     """
-    Reads pyproj_path with tomlkit, checks if [tool.poetry].package-mode == false.
+    Reads pyproj_path (cached via load_pyproject), checks if [tool.poetry].package-mode == false.
     Returns:
       (is_aggregator: bool, package_name: str)
     """
-    with open(pyproj_path, "r", encoding="utf-8") as f:
-        doc = tomlkit.parse(f.read())
+    doc = load_pyproject(pyproj_path)
 
     tool_poetry = doc.get("tool", {}).get("poetry", {})
     pkg_name = tool_poetry.get("name", "unknown")
@@ -2,10 +2,14 @@
 
 import os
 import sys
-import tomlkit
 from typing import Optional
 
-from soliloquy.ops.pyproject_ops import find_pyproject_files, extract_path_dependencies
+from soliloquy.ops.pyproject_ops import (
+    find_pyproject_files,
+    extract_path_dependencies,
+    path_dependency_pyproject,
+    load_pyproject
+)
 from soliloquy.ops.poetry_utils import run_command
 
 def lock_packages(
@@ -90,9 +94,8 @@ def _lock_local_path_deps(aggregator_pyproj: str) -> bool:
     base_dir = os.path.dirname(aggregator_pyproj)
     success = True
     for dep_rel in deps:
-        dep_abs = os.path.join(base_dir, dep_rel)
-        pyproj = os.path.join(dep_abs, "pyproject.toml")
-        if not os.path.isfile(pyproj):
+        pyproj = path_dependency_pyproject(base_dir, dep_rel)
+        if not pyproj:
             print(f"    [lock_ops] Skipping invalid path dep '{dep_rel}' (no pyproject.toml).", file=sys.stderr)
             success = False
             continue
@@ -107,8 +110,7 @@ def _check_if_aggregator(pyproj_path: str) -> (bool, str):
     Checks if 'package-mode=false'.
     Returns (is_aggregator, package_name).
     """
-    with open(pyproj_path, "r", encoding="utf-8") as f:
-        doc = tomlkit.parse(f.read())
+    doc = load_pyproject(pyproj_path)
     tool_poetry = doc.get("tool", {}).get("poetry", {})
     pkg_name = tool_poetry.get("name", "unknown")
 
@@ -2,10 +2,14 @@
 
 import os
 import sys
-import tomlkit
 from typing import Optional
 
-from soliloquy.ops.pyproject_ops import find_pyproject_files, extract_path_dependencies
+from soliloquy.ops.pyproject_ops import (
+    find_pyproject_files,
+    extract_path_dependencies,
+    path_dependency_pyproject,
+    load_pyproject
+)
 from soliloquy.ops.poetry_utils import run_command  # or use subprocess directly
 
 
@@ -66,12 +70,11 @@ def publish_packages(
 
 def _check_if_aggregator(pyproj_path: str) -> (bool, str):
     """
-    Reads pyproj_path with tomlkit, checks if [tool.poetry].package-mode == false.
+    Reads pyproj_path (cached via load_pyproject), checks if [tool.poetry].package-mode == false.
     Returns:
       (is_aggregator: bool, package_name: str)
     """
-    with open(pyproj_path, "r", encoding="utf-8") as f:
-        doc = tomlkit.parse(f.read())
+    doc = load_pyproject(pyproj_path)
 
     tool_poetry = doc.get("tool", {}).get("poetry", {})
     pkg_name = tool_poetry.get("name", "unknown")
@@ -103,9 +106,8 @@ def _publish_local_path_deps(
 
     all_ok = True
     for dep_rel in deps:
-        dep_abs = os.path.join(base_dir, dep_rel)
-        pyproj = os.path.join(dep_abs, "pyproject.toml")
-        if not os.path.isfile(pyproj):
+        pyproj = path_dependency_pyproject(base_dir, dep_rel)
+        if not pyproj:
             print(f"  [publish_ops] Skipping invalid path dep '{dep_rel}' (no pyproject.toml).", file=sys.stderr)
             all_ok = False
             continue
@@ -2,28 +2,162 @@
 """
 pyproject_ops.py
 
-- Now uses tomlkit instead of toml
+- Uses tomllib (tomli on Python < 3.11) for read-only parsing
+- Uses tomlkit where files are rewritten and formatting must be preserved
 """
 
-from typing import List
+from functools import lru_cache
+from typing import Iterator, List, Optional
 import os
+import re
+import stat
 import sys
-import tomlkit
+import uuid
 
-def extract_path_dependencies(pyproject_path):
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
+# Matches the `version = "..."` line of the [tool.poetry] table (and only that
+# table: the scan stops at the next line whose first non-blank character is
+# '[', so an indented sub-table header such as
+#   "  [tool.poetry.dependencies.foo]\n  version = \"^1\""
+# is never mistaken for the package version). Multi-line array lines that
+# start with '[' also end the scan, which just means a full-parse fallback.
+# Group 1 is everything up to the opening quote, group 2 the quote character
+# and group 3 the version itself.
+POETRY_VERSION_RE = re.compile(
+    r"""(^\[tool\.poetry\][^\n]*\n(?:(?![ \t]*\[)[^\n]*\n)*?[ \t]*version[ \t]*=[ \t]*)(["'])([^"'\n]*)\2""",
+    re.MULTILINE,
+)
+
+def _match_poetry_version(text: str) -> Optional[re.Match]:
+    """
+    POETRY_VERSION_RE.search, but refuses matches that follow a multi-line
+    string opener inside [tool.poetry]: the "version" line could then be
+    string content (e.g. inside a description) rather than the real key.
+    Sub-tables are excluded by POETRY_VERSION_RE itself (indented headers
+    included).
+    """
+    match = POETRY_VERSION_RE.search(text)
+    if match is None:
+        return None
+    prefix = match.group(1)
+    if '"""' in prefix or "'''" in prefix:
+        return None
+    return match
+
+def scan_poetry_version(text: str) -> Optional[str]:
+    """
+    Pull [tool.poetry].version out of pyproject text with a single regex
+    search, without parsing the document. Returns None if the version line
+    is not laid out in the usual `version = "..."` form, in which case the
+    caller should fall back to a real TOML parse.
+    """
+    match = _match_poetry_version(text)
+    return match.group(3) if match else None
+
+def patch_poetry_version(text: str, new_version: str) -> Optional[str]:
+    """
+    Return `text` with the [tool.poetry] version value replaced by
+    new_version, leaving every other byte untouched. Returns None if the
+    version line is not in the usual `version = "..."` form, in which case
+    the caller should fall back to a tomlkit round-trip.
+    """
+    match = _match_poetry_version(text)
+    if match is None:
+        return None
+    start, end = match.span()
+    return f"{text[:start]}{match.group(1)}{match.group(2)}{new_version}{match.group(2)}{text[end:]}"
+
+def atomic_write_text(file_path: str, content: str) -> None:
+    """
+    Write `content` to `file_path` without ever leaving it truncated.
+
+    Symlinks are resolved first so the real file is updated and the link
+    kept. The text goes to a uniquely named temp file in the same directory,
+    is flushed and fsync'd, given the original file's permission bits (a new
+    file gets the usual umask-derived mode), then moved over the original
+    with os.replace(). If anything fails, the temp file is removed and the
+    exception re-raised.
+    """
+    real_path = os.path.realpath(file_path)
+    try:
+        mode = stat.S_IMODE(os.stat(real_path).st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    # Created like open(path, "w") would (0o666 minus the umask, applied by
+    # the kernel); a random name keeps concurrent writers apart.
+    tmp_path = f"{real_path}.{uuid.uuid4().hex}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
     try:
-        with open(pyproject_path, "r", encoding="utf-8") as f:
-            doc = tomlkit.parse(f.read())
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, real_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    finally:
+        _load_pyproject_cached.cache_clear()
+
+
+def load_pyproject(pyproject_path: str) -> dict:
+    """
+    Parse a pyproject.toml for reading only.
+
+    Results are cached per (path, mtime, size, inode), so the many
+    aggregator checks and dependency lookups made against the same file
+    during one run parse it once. Any change to the file (including an
+    atomic replace) produces a new key. The returned dict is shared
+    between callers and must not be mutated.
+
+    Every caller only looks at [tool.poetry], so a file whose bytes never
+    mention "poetry" is returned as {} without being parsed at all.
+
+    Raises:
+      OSError: if the file cannot be stat'ed or opened.
+      tomllib.TOMLDecodeError: if the file is not valid TOML.
+    """
+    st = os.stat(pyproject_path)
+    return _load_pyproject_cached(pyproject_path, st.st_mtime_ns, st.st_size, st.st_ino)
+
+@lru_cache(maxsize=256)
+def _load_pyproject_cached(pyproject_path: str, mtime_ns: int, size: int, ino: int) -> dict:
+    with open(pyproject_path, "rb") as f:
+        raw = f.read()
+    if b"poetry" not in raw:
+        return {}
+    return tomllib.loads(raw.decode("utf-8"))
+
+def _load_poetry_dependencies(pyproject_path):
+    """
+    Load [tool.poetry.dependencies] from a pyproject.toml as a plain dict,
+    resolving the tool -> poetry -> dependencies path once.
+
+    Exits with status 1 if the file cannot be read or parsed.
+    """
+    try:
+        doc = load_pyproject(pyproject_path)
     except Exception as e:
         print(f"Error reading {pyproject_path}: {e}", file=sys.stderr)
         sys.exit(1)
 
-    dependencies = doc.get("tool", {}).get("poetry", {}).get("dependencies", {})
-    path_deps = []
-    for val in dependencies.values():
-        if isinstance(val, dict) and "path" in val:
-            path_deps.append(val["path"])
-    return path_deps
+    return doc.get("tool", {}).get("poetry", {}).get("dependencies", {})
+
+def extract_path_dependencies(pyproject_path):
+    dependencies = _load_poetry_dependencies(pyproject_path)
+    return [
+        val["path"]
+        for val in dependencies.values()
+        if isinstance(val, dict) and "path" in val
+    ]
 
 def extract_git_dependencies(pyproject_path):
     """
@@ -37,20 +171,12 @@ def extract_git_dependencies(pyproject_path):
     Returns:
         dict: A dictionary mapping dependency names to their details dictionaries.
     """
-    try:
-        with open(pyproject_path, "r") as f:
-            data = tomlkit.load(f)
-    except Exception as e:
-        print(f"Error reading {pyproject_path}: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    dependencies = data.get("tool", {}).get("poetry", {}).get("dependencies", {})
-    git_deps = {
-        name: details
+    dependencies = _load_poetry_dependencies(pyproject_path)
+    return {
+        name: dict(details)
         for name, details in dependencies.items()
         if isinstance(details, dict) and "git" in details
     }
-    return git_deps
 
 def update_dependency_versions(pyproject_path, new_version):
     """
@@ -68,6 +194,8 @@ def update_dependency_versions(pyproject_path, new_version):
     Returns:
         None
     """
+    import tomlkit
+
     try:
         with open(pyproject_path, "r") as f:
             data = tomlkit.load(f)
@@ -79,6 +207,8 @@ def update_dependency_versions(pyproject_path, new_version):
     dependencies = poetry_section.get("dependencies", {})
     updated_deps = {}
     base_dir = os.path.dirname(pyproject_path)
+    # Several path entries may point at the same package ("a", "./a/")
+    updated_pyprojects = set()
 
     for dep_name, details in dependencies.items():
         if isinstance(details, dict) and "path" in details:
@@ -91,16 +221,25 @@ def update_dependency_versions(pyproject_path, new_version):
             updated_deps[dep_name] = new_dep
 
             # Attempt to update the dependency's own pyproject.toml (if it exists).
-            dependency_path = os.path.join(base_dir, details["path"])
-            dependency_pyproject = os.path.join(dependency_path, "pyproject.toml")
-            if os.path.isfile(dependency_pyproject):
+            # Only its version changes, so patch that line in place and fall
+            # back to a tomlkit round-trip only for unusual layouts.
+            dependency_pyproject = path_dependency_pyproject(base_dir, details["path"])
+            if dependency_pyproject:
+                real_pyproject = os.path.realpath(dependency_pyproject)
+                if real_pyproject in updated_pyprojects:
+                    continue
+                updated_pyprojects.add(real_pyproject)
                 try:
-                    with open(dependency_pyproject, "r") as dep_file:
-                        dep_data = tomlkit.load(dep_file)
-                    if "tool" in dep_data and "poetry" in dep_data["tool"]:
-                        dep_data["tool"]["poetry"]["version"] = new_version
-                        with open(dependency_pyproject, "w") as dep_file:
-                            tomlkit.dump(dep_data, dep_file)
+                    with open(dependency_pyproject, "r", encoding="utf-8", newline="") as dep_file:
+                        dep_text = dep_file.read()
+                    patched = patch_poetry_version(dep_text, new_version)
+                    if patched is None:
+                        dep_data = tomlkit.parse(dep_text)
+                        if "tool" in dep_data and "poetry" in dep_data["tool"]:
+                            dep_data["tool"]["poetry"]["version"] = new_version
+                            patched = tomlkit.dumps(dep_data)
+                    if patched is not None:
+                        atomic_write_text(dependency_pyproject, patched)
                         print(f"Updated {dependency_pyproject} to version {new_version}")
                     else:
                         print(f"Invalid structure in {dependency_pyproject}", file=sys.stderr)
@@ -112,53 +251,146 @@ def update_dependency_versions(pyproject_path, new_version):
     # Write the updated dependencies back to the parent pyproject.toml.
     data["tool"]["poetry"]["dependencies"] = updated_deps
     try:
-        with open(pyproject_path, "w") as f:
-            tomlkit.dump(data, f)
+        atomic_write_text(pyproject_path, tomlkit.dumps(data))
         print(f"Updated dependency versions in {pyproject_path}")
     except Exception as e:
         print(f"Error writing updated file {pyproject_path}: {e}", file=sys.stderr)
         sys.exit(1)
 
 
-def find_pyproject_files(
+def path_dependency_pyproject(
+    base_dir: str,
+    dep_path: str,
+    default_filename: str = "pyproject.toml"
+) -> Optional[str]:
+    """
+    Resolve the pyproject.toml of a local path dependency.
+
+    Joins base_dir/dep_path/default_filename in one go and stats the file
+    once; if it exists as a regular file, so does its directory, so no
+    separate isdir() check is needed.
+
+    Returns:
+        The joined path if it is a regular file, else None.
+    """
+    dep_pyproject = os.path.join(base_dir, dep_path, default_filename)
+    try:
+        st = os.stat(dep_pyproject)
+    except OSError:
+        return None
+    return dep_pyproject if stat.S_ISREG(st.st_mode) else None
+
+
+def _iter_files_named(dir_path: str, filename: str) -> Iterator[str]:
+    """
+    Iterative os.scandir() walk of dir_path yielding every file called
+    `filename` as soon as its directory is listed. Entry types come from
+    the directory listing itself, so no per-entry stat() is needed.
+
+    Matches os.walk's top-down order (a directory's own file before its
+    subdirectories), does not descend into symlinked directories, and
+    skips subdirectories that cannot be read. Errors opening dir_path
+    itself (e.g. NotADirectoryError) are raised.
+    """
+    stack = [dir_path]
+    while stack:
+        current = stack.pop()
+        subdirs = []
+        match = None
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.name == filename and entry.is_file():
+                            match = entry.path
+                    except OSError:
+                        continue
+        except OSError:
+            if current is dir_path:
+                raise
+            continue
+        if match:
+            yield match
+        # Reversed so the first listed subdirectory is visited first
+        stack.extend(reversed(subdirs))
+
+
+def _stat_mode(path: str) -> int:
+    """
+    st_mode of path, or 0 if it cannot be stat'ed (so every S_IS* test fails).
+    """
+    try:
+        return os.stat(path).st_mode
+    except OSError:
+        return 0
+
+
+def iter_pyproject_files(
     file: str = None,
     directory: str = None,
     recursive: bool = False,
     default_filename: str = "pyproject.toml"
-) -> List[str]:
+) -> Iterator[str]:
     """
-    Resolve which pyproject.toml file(s) to operate on.
-      1. If `file` is provided, return just that file.
-      2. Else if `directory` is provided:
-          - If 'recursive' is True, walk subdirs for default_filename.
-          - Otherwise, just look for default_filename in that one directory.
-      3. Otherwise, raise an error.
+    Generator form of find_pyproject_files: same resolution rules, same
+    order and same errors, but each path is yielded as soon as it is found
+    so callers can start work while a recursive scan is still running.
+
+    Errors about a missing file/directory are raised on the first next();
+    "nothing found recursively" is raised once the walk is exhausted.
     """
     if file:
         path = os.path.abspath(file)
-        if not os.path.isfile(path):
+        if not stat.S_ISREG(_stat_mode(path)):
             raise FileNotFoundError(f"File not found: {path}")
-        return [path]
+        yield path
+        return
 
     if directory:
         dir_path = os.path.abspath(directory)
-        if not os.path.isdir(dir_path):
-            raise NotADirectoryError(f"Directory not found: {dir_path}")
 
+        # One stat (or the root scandir) on the happy path; the directory
+        # itself is only stat'ed separately to word the error.
         if recursive:
-            matched = []
-            for root, dirs, files in os.walk(dir_path):
-                if default_filename in files:
-                    matched.append(os.path.join(root, default_filename))
-            if not matched:
+            found = False
+            try:
+                for match in _iter_files_named(dir_path, default_filename):
+                    found = True
+                    yield match
+            except (FileNotFoundError, NotADirectoryError):
+                raise NotADirectoryError(f"Directory not found: {dir_path}")
+            if not found:
                 raise FileNotFoundError(
                     f"No {default_filename} found recursively in {dir_path}"
                 )
-            return matched
         else:
             single = os.path.join(dir_path, default_filename)
-            if not os.path.isfile(single):
+            if not stat.S_ISREG(_stat_mode(single)):
+                if not stat.S_ISDIR(_stat_mode(dir_path)):
+                    raise NotADirectoryError(f"Directory not found: {dir_path}")
                 raise FileNotFoundError(f"No {default_filename} in {dir_path}")
-            return [single]
+            yield single
+        return
+
+    raise ValueError("Must provide either `file` or `directory`.")
+
 
-    raise ValueError("Must provide either `file` or `directory`.")
\ No newline at end of file
+def find_pyproject_files(
+    file: str = None,
+    directory: str = None,
+    recursive: bool = False,
+    default_filename: str = "pyproject.toml"
+) -> List[str]:
+    """
+    Resolve which pyproject.toml file(s) to operate on.
+      1. If `file` is provided, return just that file.
+      2. Else if `directory` is provided:
+          - If 'recursive' is True, walk subdirs for default_filename.
+          - Otherwise, just look for default_filename in that one directory.
+      3. Otherwise, raise an error.
+
+    See iter_pyproject_files for a lazily-evaluated variant.
+    """
+    return list(iter_pyproject_files(file, directory, recursive, default_filename))
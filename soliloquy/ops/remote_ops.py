@@ -2,14 +2,66 @@
 
 import os
 import sys
-import requests
-from typing import Optional, List, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
 
 from urllib.parse import urljoin
-from tomlkit import parse, dumps, inline_table
+
+from packaging.version import Version, InvalidVersion
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
 
 # If you have a function for discovering relevant pyproject.toml files:
-from soliloquy.ops.pyproject_ops import find_pyproject_files
+from soliloquy.ops.pyproject_ops import find_pyproject_files, atomic_write_text, scan_poetry_version
+
+# One keep-alive session for all raw.githubusercontent.com lookups, so
+# repeated fetches reuse the TCP/TLS connection. Created on first use so
+# that importing this module (e.g. from the CLI) doesn't import requests.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+_FETCH_TIMEOUT = (3.05, 10)
+
+
+def _get_session():
+    """
+    Returns the shared requests.Session, creating it on first call.
+    The pool is sized to match the fetch thread pool in
+    update_pyproject_with_versions.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=16,
+                max_retries=Retry(total=2, backoff_factor=0.1)
+            ))
+            _SESSION = session
+    return _SESSION
+
+
+def _is_plausible_version(value: str) -> bool:
+    """True if value parses as a PEP 440 version."""
+    try:
+        Version(value)
+    except InvalidVersion:
+        return False
+    return True
+
+
+class _RemoteVersionLookupError(Exception):
+    """Raised inside the cached fetch so that failures are never memoized."""
+
 
 def fetch_remote_pyproject_version(
     git_url: str,
@@ -22,47 +74,96 @@ def fetch_remote_pyproject_version(
 
     - Only handles GitHub repos at the moment.
     - If subdirectory is provided, it is appended to the raw URL path.
+    - Successful lookups are memoized per raw pyproject URL (i.e. per
+      repo/branch/subdirectory) for the life of the process; failures (timeouts, HTTP errors, missing
+      version) are not, so a later call retries. Call
+      fetch_remote_pyproject_version.cache_clear() to force fresh lookups.
 
     Returns:
         The version string (e.g. '1.2.3') if found, else None.
     """
+    version, messages = _lookup_remote_version(git_url, branch, subdirectory)
+    _print_messages(messages)
+    return version
+
+
+def _lookup_remote_version(
+    git_url: str,
+    branch: str,
+    subdirectory: str
+) -> Tuple[Optional[str], List[Tuple[str, bool]]]:
+    """
+    fetch_remote_pyproject_version without the printing: returns
+    (version or None, [(message, is_error), ...]) so callers running
+    lookups concurrently can report each one under its own heading.
+    """
+    messages = []
+    try:
+        pyproject_url = _remote_pyproject_url(git_url, branch, subdirectory)
+        messages.append((f"[remote_ops] Fetching remote pyproject from {pyproject_url}", False))
+        return _fetch_remote_pyproject_version_cached(pyproject_url), messages
+    except _RemoteVersionLookupError as e:
+        messages.append((f"[remote_ops] {e}", True))
+        return None, messages
+
+
+def _print_messages(messages: List[Tuple[str, bool]]) -> None:
+    for message, is_error in messages:
+        print(message, file=sys.stderr if is_error else sys.stdout)
+
+
+def _remote_pyproject_url(git_url: str, branch: str, subdirectory: str) -> str:
+    """
+    Raw GitHub URL of the pyproject.toml for a Git dependency, e.g.
+    https://raw.githubusercontent.com/<user>/<repo>/<branch>/<subdirectory>/pyproject.toml
+    """
     if "github.com" not in git_url:
-        print(f"[remote_ops] Currently only supports GitHub: {git_url}", file=sys.stderr)
-        return None
+        raise _RemoteVersionLookupError(f"Currently only supports GitHub: {git_url}")
 
     # Remove trailing .git if present
     repo_path = git_url.split("github.com/")[-1]
     if repo_path.endswith(".git"):
         repo_path = repo_path[:-4]
 
-    # Construct the raw URL to the pyproject.toml
-    # e.g. https://raw.githubusercontent.com/<user>/<repo>/<branch>/<subdirectory>/pyproject.toml
     base_url = f"https://raw.githubusercontent.com/{repo_path}/{branch}/"
     if subdirectory and not subdirectory.endswith("/"):
         subdirectory += "/"
-    pyproject_url = urljoin(base_url, f"{subdirectory}pyproject.toml")
+    return urljoin(base_url, f"{subdirectory}pyproject.toml")
+
 
-    print(f"[remote_ops] Fetching remote pyproject from {pyproject_url}")
+@lru_cache(maxsize=512)
+def _fetch_remote_pyproject_version_cached(pyproject_url: str) -> str:
     try:
-        resp = requests.get(pyproject_url)
+        resp = _get_session().get(pyproject_url, timeout=_FETCH_TIMEOUT)
         resp.raise_for_status()
     except Exception as e:
-        print(f"[remote_ops] Failed to fetch {pyproject_url}: {e}", file=sys.stderr)
-        return None
+        raise _RemoteVersionLookupError(f"Failed to fetch {pyproject_url}: {e}") from e
 
     try:
-        doc = parse(resp.text)
-        version = doc.get("tool", {}).get("poetry", {}).get("version")
-        if not version:
-            print(f"[remote_ops] No version found in remote pyproject.toml at {pyproject_url}", file=sys.stderr)
-            return None
-        return version
+        # Cheap regex scan first; full parse only for unusual layouts
+        version = scan_poetry_version(resp.text)
+        if version is not None and not _is_plausible_version(version):
+            # Scan picked up something that isn't a version; trust the parser
+            version = None
+        if version is None:
+            doc = tomllib.loads(resp.text)
+            version = doc.get("tool", {}).get("poetry", {}).get("version")
     except Exception as e:
-        print(f"[remote_ops] Could not parse remote TOML: {e}", file=sys.stderr)
-        return None
+        raise _RemoteVersionLookupError(f"Could not parse remote TOML: {e}") from e
 
+    if not version:
+        raise _RemoteVersionLookupError(f"No version found in remote pyproject.toml at {pyproject_url}")
+    return version
 
-def update_pyproject_with_versions(file_path: str) -> Dict[str, Any]:
+
+# Public hook for entrypoints/tests that need fresh remote lookups
+fetch_remote_pyproject_version.cache_clear = _fetch_remote_pyproject_version_cached.cache_clear
+
+
+def update_pyproject_with_versions(
+    file_path: str,
+    output_file_path: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Reads a local pyproject.toml, and for each Git-based dependency:
       - fetches the remote version (if possible),
@@ -70,12 +171,17 @@ def update_pyproject_with_versions(file_path: str) -> Dict[str, Any]:
       - sets 'version' = ^<remote_version>,
       - keeps 'optional' if it was present.
 
+    The result is written atomically to output_file_path, or back to
+    file_path if no output path is given.
+
     Returns a dict describing the result:
       {
         "success": bool,
         "error": Optional[str],   # If success=False, here's an error message
       }
     """
+    from tomlkit import parse, dumps, inline_table
+
     if not os.path.isfile(file_path):
         msg = f"[remote_ops] File not found: {file_path}"
         print(msg, file=sys.stderr)
@@ -83,7 +189,10 @@ def update_pyproject_with_versions(file_path: str) -> Dict[str, Any]:
 
     try:
         with open(file_path, "r", encoding="utf-8") as f:
-            doc = parse(f.read())
+            content = f.read()
+        # A file that never mentions "poetry" cannot have [tool.poetry];
+        # skip the (comparatively slow) tomlkit parse.
+        doc = parse(content) if "poetry" in content else {}
     except Exception as e:
         msg = f"[remote_ops] Error reading {file_path}: {e}"
         print(msg, file=sys.stderr)
@@ -107,6 +216,8 @@ def update_pyproject_with_versions(file_path: str) -> Dict[str, Any]:
 
     updated_any = False
 
+    # Collect every Git dep first so the remote lookups can run concurrently
+    git_deps = []
     for dep_name, details in list(dependencies.items()):
         if not (isinstance(details, dict) and "git" in details):
             continue
@@ -115,9 +226,22 @@ def update_pyproject_with_versions(file_path: str) -> Dict[str, Any]:
         branch = details.get("branch", "main")
         subdir = details.get("subdirectory", "")
         originally_optional = bool(details.get("optional", False)) or dep_in_extras(dep_name)
-
+        git_deps.append((dep_name, git_url, branch, subdir, originally_optional))
+
+    # Workers only collect their messages; they are printed below, under
+    # each dependency's heading, so output order never depends on timing.
+    lookups = []
+    if git_deps:
+        with ThreadPoolExecutor(max_workers=min(16, len(git_deps))) as executor:
+            lookups = list(executor.map(
+                lambda dep: _lookup_remote_version(dep[1], dep[2], dep[3]),
+                git_deps
+            ))
+
+    # Apply the results serially; tomlkit documents are not thread-safe
+    for (dep_name, git_url, branch, subdir, originally_optional), (remote_ver, messages) in zip(git_deps, lookups):
         print(f"\n[remote_ops] Checking Git dep '{dep_name}' -> {git_url}@{branch} subdir='{subdir}'")
-        remote_ver = fetch_remote_pyproject_version(git_url, branch, subdir)
+        _print_messages(messages)
         if not remote_ver:
             print(f"  [remote_ops] Could not get remote version for '{dep_name}'. Skipping update.")
             continue
@@ -143,34 +267,26 @@ def update_pyproject_with_versions(file_path: str) -> Dict[str, Any]:
     tool_poetry["dependencies"] = dependencies
 
     # Attempt to write back
+    target = output_file_path or file_path
     try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(dumps(doc))
-        print(f"[remote_ops] Updated file written to {file_path}")
+        atomic_write_text(target, dumps(doc))
+        print(f"[remote_ops] Updated file written to {target}")
         return {"success": True, "error": None}
     except Exception as e:
-        msg = f"[remote_ops] Error writing updated pyproject to {file_path}: {e}"
+        msg = f"[remote_ops] Error writing updated pyproject to {target}: {e}"
         print(msg, file=sys.stderr)
         return {"success": False, "error": msg}
 
 
 def update_and_write_pyproject(input_file_path: str, output_file_path: Optional[str] = None) -> bool:
     """
-    (unchanged except that the new update_pyproject_with_versions logic removes the unwanted keys)
-    """
-    updated_doc_str = update_pyproject_with_versions(input_file_path)
-    if updated_doc_str is None:
-        return False
+    Runs update_pyproject_with_versions on input_file_path and writes the
+    result (atomically) to output_file_path, or in place if none is given.
 
-    target = output_file_path or input_file_path
-    try:
-        with open(target, "w", encoding="utf-8") as f:
-            f.write(updated_doc_str)
-        print(f"[remote_ops] Updated file written to {target}")
-        return True
-    except Exception as e:
-        print(f"[remote_ops] Error writing updated pyproject to {target}: {e}", file=sys.stderr)
-        return False
+    Returns True on success, False otherwise.
+    """
+    result = update_pyproject_with_versions(input_file_path, output_file_path)
+    return result["success"]
 
 
 def remote_update_bulk(
@@ -7,23 +7,25 @@ import tempfile
 import shutil
 from typing import Dict, List, Union, Tuple, Optional
 
-import tomlkit
-
 from soliloquy.ops.pyproject_ops import (
     find_pyproject_files,
     extract_path_dependencies,
-    extract_git_dependencies
+    extract_git_dependencies,
+    load_pyproject
 )
 from soliloquy.ops.poetry_utils import run_command  # For uniform command calls, if desired
 
 
 def run_pytests(
     test_directory: str = ".",
-    num_workers: int = 1
+    num_workers: int = 1,
+    in_process: bool = False
 ) -> Dict[str, Union[bool, int, str]]:
     """
     Runs pytest (via 'poetry run pytest') in the given directory.
     If num_workers > 1, runs pytest with '-n <num_workers>' for parallel tests.
+    If in_process is True, runs pytest inside the current interpreter instead
+    (see _run_pytest_inproc).
 
     Returns a dict with:
       {
@@ -32,6 +34,15 @@ def run_pytests(
         "directory": str,       # The directory tested
       }
     """
+    if in_process:
+        print(f"[test_ops] Running tests in {test_directory} -> pytest (in-process)")
+        rc = _run_pytest_inproc(test_directory, num_workers)
+        return {
+            "success": (rc == 0),
+            "returncode": rc,
+            "directory": test_directory,
+        }
+
     cmd = ["poetry", "run", "pytest"]
     if num_workers > 1:
         cmd.extend([
@@ -52,13 +63,48 @@ def run_pytests(
     }
 
 
+def _run_pytest_inproc(test_directory: str, num_workers: int = 1) -> int:
+    """
+    Runs pytest via pytest.main() in the current interpreter, skipping the
+    'poetry run' subprocess and its interpreter/plugin startup.
+
+    Only valid when the packages under test are importable from the
+    environment soliloquy itself runs in (e.g. a monorepo installed into
+    one shared virtualenv), and only once per process: test and conftest
+    modules stay in sys.modules after pytest.main() returns, so a second
+    run over another package would reuse or clash with them.
+
+    Like the subprocess path, pytest runs with test_directory as the
+    working directory.
+
+    Returns pytest's exit code as an int.
+    """
+    import pytest
+
+    args = ["-q"]
+    if num_workers > 1:
+        args.extend([
+            "-n",
+            str(num_workers),
+            "--dist=loadfile"
+            ])
+
+    previous_cwd = os.getcwd()
+    os.chdir(test_directory)
+    try:
+        return int(pytest.main(args))
+    finally:
+        os.chdir(previous_cwd)
+
+
 def run_tests_with_mode(
     file: str = None,
     directory: str = None,
     recursive: bool = False,
     mode: str = "single",
     num_workers: int = 1,
-    cleanup: bool = True
+    cleanup: bool = True,
+    in_process: bool = False
 ) -> Dict[str, Union[bool, List[Dict[str, Union[bool, int, str]]], Optional[str]]]:
     """
     Entry point to run tests according to a 'mode'.
@@ -69,6 +115,9 @@ def run_tests_with_mode(
         recursive: If True, find multiple pyprojects recursively (used for fallback).
         mode: "single", "monorepo", or "each".
         num_workers: Parallel workers for pytest (-n).
+        in_process: If True, run pytest in-process instead of via 'poetry run'.
+                    Only honoured for "single" and "monorepo" (one pytest run);
+                    "each" always uses a subprocess per package.
 
     Returns:
       {
@@ -81,6 +130,11 @@ def run_tests_with_mode(
         print(f"[test_ops] Invalid test mode: {mode}", file=sys.stderr)
         return {"success": False, "details": [], "git_temp_dir": None}
 
+    if in_process and mode == "each":
+        # pytest.main() can only be called once per process reliably.
+        print("[test_ops] --in-process-tests is not supported with mode 'each'; using 'poetry run pytest' per package.")
+        in_process = False
+
     # ------------------------------------------------------
     # Discover pyprojects
     # ------------------------------------------------------
@@ -94,7 +148,7 @@ def run_tests_with_mode(
     if not pyprojects:
         print("[test_ops] No pyproject.toml found. Running single test in the specified directory.")
         test_dir = directory or "."
-        result = run_pytests(test_dir, num_workers)
+        result = run_pytests(test_dir, num_workers, in_process)
         return {"success": result["success"], "details": [result], "git_temp_dir": None}
 
     # We'll consider the first pyproject as "primary" unless mode=each.
@@ -107,7 +161,7 @@ def run_tests_with_mode(
     if mode == "single":
         # Just run 1 test in the directory (like a standalone approach)
         test_dir = directory or os.path.dirname(primary_pyproj)
-        result = run_pytests(test_dir, num_workers)
+        result = run_pytests(test_dir, num_workers, in_process)
         return {"success": result["success"], "details": [result], "git_temp_dir": None}
 
     # ------------------------------------------------------
@@ -116,7 +170,7 @@ def run_tests_with_mode(
     elif mode == "monorepo":
         # Run a single test from the top-level directory (like one big combined run)
         test_dir = directory or os.path.dirname(primary_pyproj)
-        result = run_pytests(test_dir, num_workers)
+        result = run_pytests(test_dir, num_workers, in_process)
         return {"success": result["success"], "details": [result], "git_temp_dir": None}
 
     # ------------------------------------------------------
@@ -175,12 +229,11 @@ def run_tests_with_mode(
 
 def _check_if_aggregator(pyproj_path: str) -> (bool, str):
     """
-    Parses 'pyproj_path' with tomlkit and checks if [tool.poetry.package-mode] is False.
+    Parses 'pyproj_path' (cached via load_pyproject) and checks if [tool.poetry.package-mode] is False.
     Returns:
       (is_aggregator, package_name)
     """
-    with open(pyproj_path, "r", encoding="utf-8") as f:
-        doc = tomlkit.parse(f.read())
+    doc = load_pyproject(pyproj_path)
     poetry_table = doc.get("tool", {}).get("poetry", {})
     pkg_name = poetry_table.get("name", "unknown")
 
@@ -1,17 +1,42 @@
 # soliloquy/ops/version_ops.py
 
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Tuple
 from packaging.version import Version, InvalidVersion
-from tomlkit import parse, dumps
 
-# Import your existing "find_pyproject_files" or define it in pyproject_ops:
-from soliloquy.ops.pyproject_ops import find_pyproject_files
+# Import your existing "iter_pyproject_files" or define it in pyproject_ops:
+from soliloquy.ops.pyproject_ops import (
+    iter_pyproject_files,
+    atomic_write_text,
+    load_pyproject,
+    patch_poetry_version,
+)
+
+# Plain final "X.Y.Z" release; anything else goes through packaging.Version
+_SIMPLE_VERSION_RE = re.compile(r"([0-9]+)\.([0-9]+)\.([0-9]+)\Z")
+
+
+@lru_cache(maxsize=1024)
+def _parse_version(version: str) -> Version:
+    """
+    Memoized Version(...) constructor. The same version strings are parsed
+    over and over in a bulk bump (bump, then validate), so cache them.
+    InvalidVersion propagates and is never cached.
+    """
+    return Version(version)
 
 
 def read_pyproject_version(file_path: str) -> str:
     """
     Reads the current version from the given pyproject.toml file.
 
+    Goes through pyproject_ops.load_pyproject, so an unchanged file is only
+    parsed once per run no matter how many passes consult it; any write
+    (new mtime/size/inode) is picked up automatically.
+
     Returns:
       The version string (e.g. '1.2.3.dev1').
 
@@ -24,9 +49,7 @@ def read_pyproject_version(file_path: str) -> str:
         raise FileNotFoundError(f"File not found: {file_path}")
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        doc = parse(content)
+        doc = load_pyproject(file_path)
     except Exception as e:
         raise ValueError(f"Could not parse TOML from {file_path}: {e}") from e
 
@@ -42,6 +65,10 @@ def write_pyproject_version(file_path: str, new_version: str) -> None:
     Writes the given new_version string (e.g. '1.2.3.dev2') into pyproject.toml
     at [tool.poetry].version.
 
+    The version line is patched in place so the rest of the file is kept
+    byte-for-byte; only if that line cannot be located do we fall back to
+    a full tomlkit parse + dumps.
+
     Raises:
       FileNotFoundError: if the file is missing.
       ValueError: if the file cannot be parsed correctly or structure is invalid.
@@ -50,24 +77,36 @@ def write_pyproject_version(file_path: str, new_version: str) -> None:
         raise FileNotFoundError(f"File not found: {file_path}")
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            doc = parse(f.read())
+        with open(file_path, "r", encoding="utf-8", newline="") as f:
+            content = f.read()
     except Exception as e:
-        raise ValueError(f"Could not parse TOML from {file_path}: {e}") from e
+        raise ValueError(f"Could not read {file_path}: {e}") from e
+
+    new_content = patch_poetry_version(content, new_version)
+
+    if new_content is None:
+        # Unusual layout (e.g. inline or dotted keys) -> full round-trip
+        from tomlkit import parse, dumps
 
-    if "tool" not in doc or "poetry" not in doc["tool"]:
-        raise ValueError(f"Invalid structure in {file_path}; no [tool.poetry] table.")
+        try:
+            doc = parse(content)
+        except Exception as e:
+            raise ValueError(f"Could not parse TOML from {file_path}: {e}") from e
 
-    doc["tool"]["poetry"]["version"] = new_version
+        if "tool" not in doc or "poetry" not in doc["tool"]:
+            raise ValueError(f"Invalid structure in {file_path}; no [tool.poetry] table.")
+
+        doc["tool"]["poetry"]["version"] = new_version
+        new_content = dumps(doc)
 
     # Write updated file
     try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(dumps(doc))
+        atomic_write_text(file_path, new_content)
     except Exception as e:
         raise ValueError(f"Failed writing updated pyproject.toml to {file_path}: {e}") from e
 
 
+@lru_cache(maxsize=256)
 def bump_version(current_version: str, bump_type: str) -> str:
     """
     Bumps the given current_version using one of:
@@ -76,13 +115,25 @@ def bump_version(current_version: str, bump_type: str) -> str:
       - 'patch' -> if dev, increment dev number; else X.Y.Z+1.dev1
       - 'finalize' -> remove .devN if present
 
-    Returns the new version string.
+    Returns the new version string. Pure function of its two arguments, so
+    results are memoized (sibling packages usually share a version);
+    errors are raised, not cached.
 
     Raises:
       ValueError: if the version is invalid or the bump operation is invalid.
     """
+    # Fast path: a final X.Y.Z needs no Version object for major/minor/patch
+    simple = _SIMPLE_VERSION_RE.match(current_version)
+    if simple and bump_type in ("major", "minor", "patch"):
+        major, minor, patch = map(int, simple.groups())
+        if bump_type == "major":
+            return f"{major + 1}.0.0.dev1"
+        if bump_type == "minor":
+            return f"{major}.{minor + 1}.0.dev1"
+        return f"{major}.{minor}.{patch + 1}.dev1"
+
     try:
-        ver = Version(current_version)
+        ver = _parse_version(current_version)
     except InvalidVersion as e:
         raise ValueError(f"Invalid current version '{current_version}': {e}") from e
 
@@ -125,10 +176,15 @@ def validate_new_version_is_not_lower(current_version: str, new_version: str) ->
     """
     Raises ValueError if new_version is lower than current_version.
     Otherwise, returns None (success).
+
+    Identical strings are only parsed once (to keep rejecting invalid input)
+    and never compared.
     """
     try:
-        cur_ver = Version(current_version)
-        tgt_ver = Version(new_version)
+        cur_ver = _parse_version(current_version)
+        if new_version == current_version:
+            return
+        tgt_ver = _parse_version(new_version)
     except InvalidVersion as e:
         raise ValueError(f"Invalid version provided: {e}") from e
 
@@ -136,6 +192,65 @@ def validate_new_version_is_not_lower(current_version: str, new_version: str) ->
         raise ValueError("You cannot bump the version downwards; target version must be >= current version.")
 
 
+def plan_version_update(pyproj: str, bump: str = None, set_ver: str = None) -> Tuple[str, str]:
+    """
+    Works out the version change for a single pyproject.toml without
+    touching it:
+      - reads the current version,
+      - either bumps or sets it,
+      - checks that new version is not lower.
+
+    Returns:
+      (current_version, new_version)
+    """
+    current_ver = read_pyproject_version(pyproj)
+
+    if bump:
+        new_ver = bump_version(current_ver, bump)
+    else:
+        # set_ver path
+        new_ver = set_ver
+
+    # Validate new version >= current version
+    validate_new_version_is_not_lower(current_ver, new_ver)
+
+    return current_ver, new_ver
+
+
+def bump_or_set_version(pyproj: str, bump: str = None, set_ver: str = None) -> Tuple[str, str]:
+    """
+    Updates the version of a single pyproject.toml:
+      - reads the current version,
+      - either bumps or sets it,
+      - checks that new version is not lower,
+      - writes the updated version back.
+
+    Returns:
+      (current_version, new_version)
+    """
+    current_ver, new_ver = plan_version_update(pyproj, bump, set_ver)
+
+    # Finally write to file
+    write_pyproject_version(pyproj, new_ver)
+
+    return current_ver, new_ver
+
+
+def _results_in_order(futures):
+    """
+    Yields (key, result) for a list of (key, future) pairs in list order.
+    On the first failure every future not yet started is cancelled and the
+    error re-raised.
+    """
+    for i, (key, future) in enumerate(futures):
+        try:
+            yield key, future.result()
+        except BaseException:
+            for _, pending in futures[i + 1:]:
+                pending.cancel()
+            raise
+
+
 def bulk_bump_or_set_version(
     file: str = None,
     directory: str = None,
@@ -145,11 +260,14 @@ def bulk_bump_or_set_version(
 ) -> None:
     """
     Finds pyproject.toml files via file/directory/recursive logic,
-    then for each:
-      - reads the current version,
-      - either bumps or sets it,
-      - checks that new version is not lower,
-      - writes the updated version back.
+    then bumps or sets the version of each.
+
+    Runs in two phases on a thread pool:
+      1. read + bump + validate every file (started as files are discovered),
+      2. only if all of them passed, write the new versions.
+    A single invalid file therefore leaves every file untouched. Results
+    are reported in discovery order; the first error is re-raised and
+    anything not yet started is cancelled.
 
     :param file: Path to a single pyproject.toml (standalone).
     :param directory: Directory containing one or more pyproject.toml.
@@ -161,26 +279,23 @@ def bulk_bump_or_set_version(
         print("[version_ops] No bump or set_ver specified. Skipping version update.")
         return
 
-    try:
-        pyproject_files = find_pyproject_files(file, directory, recursive)
-    except Exception as e:
-        raise RuntimeError(f"Error discovering pyproject files: {e}") from e
-
-    for pyproj in pyproject_files:
-        print(f"[version_ops] Updating version in {pyproj} ...")
-
-        current_ver = read_pyproject_version(pyproj)
-
-        if bump:
-            new_ver = bump_version(current_ver, bump)
-        else:
-            # set_ver path
-            new_ver = set_ver
-
-        # Validate new version >= current version
-        validate_new_version_is_not_lower(current_ver, new_ver)
-
-        # Finally write to file
-        write_pyproject_version(pyproj, new_ver)
-
-        print(f"    {current_ver} -> {new_ver}")
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        plans = []
+        try:
+            for pyproj in iter_pyproject_files(file, directory, recursive):
+                plans.append((pyproj, executor.submit(plan_version_update, pyproj, bump, set_ver)))
+        except Exception as e:
+            for _, pending in plans:
+                pending.cancel()
+            raise RuntimeError(f"Error discovering pyproject files: {e}") from e
+
+        planned = list(_results_in_order(plans))
+
+        writes = [
+            (item, executor.submit(write_pyproject_version, item[0], item[1][1]))
+            for item in planned
+        ]
+        for (pyproj, (current_ver, new_ver)), _ in _results_in_order(writes):
+            print(f"[version_ops] Updating version in {pyproj} ...")
+            print(f"    {current_ver} -> {new_ver}")
@@ -53,7 +53,8 @@ def run_release(args: Any) -> None:
         build_ok = build_packages(
             file=args.file,
             directory=args.directory,
-            recursive=args.recursive
+            recursive=args.recursive,
+            num_workers=getattr(args, "num_workers", 1)
         )
         if not build_ok:
             print("[release] Build failed. Exiting.", file=sys.stderr)
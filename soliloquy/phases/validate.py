@@ -33,7 +33,8 @@ def run_validate(args: Any) -> Dict[str, Union[bool, List[Dict[str, Union[bool,
         recursive=args.recursive,
         mode=getattr(args, "test_mode", "single"),
         num_workers=getattr(args, "num_workers", 1),
-        cleanup=cleanup_bool
+        cleanup=cleanup_bool,
+        in_process=getattr(args, "in_process_tests", False)
     )
 
     # 2) Analyze if '--results-json' is provided